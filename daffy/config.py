@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import os
+import re
+import sys
+import threading
 from functools import lru_cache
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-import tomli
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    import tomli as tomllib
 
 # Configuration keys
 _KEY_STRICT = "strict"
@@ -26,60 +36,228 @@ _DEFAULT_CHECKS_MAX_SAMPLES = 5
 _DEFAULT_ALLOW_EMPTY = True
 
 
-_DEFAULTS: dict[str, Any] = {
-    _KEY_STRICT: _DEFAULT_STRICT,
-    _KEY_LAZY: _DEFAULT_LAZY,
-    _KEY_STRICT_SPECS: _DEFAULT_STRICT_SPECS,
-    _KEY_ROW_VALIDATION_MAX_ERRORS: _DEFAULT_MAX_ERRORS,
-    _KEY_CHECKS_MAX_SAMPLES: _DEFAULT_CHECKS_MAX_SAMPLES,
-    _KEY_ALLOW_EMPTY: _DEFAULT_ALLOW_EMPTY,
-}
+_DEFAULTS: MappingProxyType[str, Any] = MappingProxyType(
+    {
+        _KEY_STRICT: _DEFAULT_STRICT,
+        _KEY_LAZY: _DEFAULT_LAZY,
+        _KEY_STRICT_SPECS: _DEFAULT_STRICT_SPECS,
+        _KEY_ROW_VALIDATION_MAX_ERRORS: _DEFAULT_MAX_ERRORS,
+        _KEY_CHECKS_MAX_SAMPLES: _DEFAULT_CHECKS_MAX_SAMPLES,
+        _KEY_ALLOW_EMPTY: _DEFAULT_ALLOW_EMPTY,
+    }
+)
 
 
-def load_config(cwd: Path | None = None) -> dict[str, Any]:
-    """Load daffy configuration from pyproject.toml."""
-    config = dict(_DEFAULTS)
+# Distinguishes an absent key from one explicitly set to a falsy value
+_MISSING = object()
+
+_BOOL_KEYS = (_KEY_STRICT, _KEY_LAZY, _KEY_STRICT_SPECS, _KEY_ALLOW_EMPTY)
+_INT_KEYS = (_KEY_ROW_VALIDATION_MAX_ERRORS, _KEY_CHECKS_MAX_SAMPLES)
+
+
+def _validate_bool_config(key: str, value: Any) -> bool:
+    if not isinstance(value, bool):
+        raise TypeError(f"Config '{key}' must be a boolean, got {type(value).__name__}: {value!r}")
+    return value
+
+
+def _validate_int_config(key: str, value: Any) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError(f"Config '{key}' must be an integer, got {type(value).__name__}: {value!r}")
+    if value < 1:
+        raise ValueError(f"Config '{key}' must be >= 1, got {value}")
+    return value
+
+
+_VALIDATORS: tuple[tuple[str, Callable[[str, Any], Any]], ...] = tuple(
+    (key, _validate_bool_config) for key in _BOOL_KEYS
+) + tuple((key, _validate_int_config) for key in _INT_KEYS)
+
+
+_ENV_PREFIX = "DAFFY_"
+_ENV_TRUE = frozenset({"1", "true", "yes", "on"})
+_ENV_FALSE = frozenset({"0", "false", "no", "off"})
+
+
+def _parse_bool_env(name: str, raw: str) -> bool:
+    value = raw.strip().lower()
+    if value in _ENV_TRUE:
+        return True
+    if value in _ENV_FALSE:
+        return False
+    raise ValueError(f"Environment variable '{name}' must be a boolean (true/false/1/0), got {raw!r}")
+
+
+def _parse_int_env(name: str, raw: str) -> int:
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(f"Environment variable '{name}' must be an integer, got {raw!r}") from None
+    if value < 1:
+        raise ValueError(f"Environment variable '{name}' must be >= 1, got {value}")
+    return value
+
+
+_ENV_PARSERS: tuple[tuple[str, str, Callable[[str, str], Any]], ...] = tuple(
+    (key, _ENV_PREFIX + key.upper(), _parse_bool_env) for key in _BOOL_KEYS
+) + tuple((key, _ENV_PREFIX + key.upper(), _parse_int_env) for key in _INT_KEYS)
+
+
+def _read_env_overrides() -> dict[str, Any]:
+    """Read settings from DAFFY_* environment variables, e.g. DAFFY_STRICT=true.
+
+    Empty or blank variables (DAFFY_STRICT=) are treated as unset.
+    """
+    overrides: dict[str, Any] = {}
+    for key, name, parse in _ENV_PARSERS:
+        raw = os.environ.get(name)
+        if raw is not None and raw.strip():
+            overrides[key] = parse(name, raw)
+    return overrides
+
+
+# A plain `[tool.daffy]` header and the lines after it, up to the next table header
+_DAFFY_SECTION_RE = re.compile(r"^[ \t]*\[tool\.daffy\][ \t]*(?:#[^\r\n]*)?\r?$(?:\n(?![ \t]*\[).*)*", re.MULTILINE)
+
+# A line that names daffy as a key or table-header segment, e.g. `[tool.daffy.extra]`,
+# `daffy.strict = true` or `tool."daffy".lazy = true`; mentions in values don't count
+_KEY_SEGMENT = r"""(?:[\w-]+|"[^"\r\n]*"|'[^'\r\n]*')"""
+_DAFFY_PATH = rf"""(?:{_KEY_SEGMENT}[ \t]*\.[ \t]*)*(?:daffy|"daffy"|'daffy')"""
+_DAFFY_KEY_RE = re.compile(
+    rf"^[ \t]*(?:\[\[?[ \t]*{_DAFFY_PATH}[ \t]*[.\]]|{_DAFFY_PATH}[ \t]*[.=])",
+    re.MULTILINE,
+)
+
+
+def _parse_daffy_section(text: str) -> dict[str, Any]:
+    """Parse the [tool.daffy] table out of pyproject.toml text.
+
+    Large pyproject files are mostly other tools' settings, so when daffy is mentioned
+    in keys only by a plain `[tool.daffy]` section, just that section is parsed; mentions
+    in values elsewhere, such as a dependency on daffy, don't matter. Anything else -
+    dotted keys, subtables, a multi-line string before the section, or a section the
+    slice can't parse on its own - falls back to parsing the whole file.
+    """
+    if "daffy" not in text:
+        return {}
+
+    match = _DAFFY_SECTION_RE.search(text)
+    if (
+        match
+        # A multi-line string before the header may contain it, e.g. a template
+        and text.find('"""', 0, match.start()) == -1
+        and text.find("'''", 0, match.start()) == -1
+        and not _DAFFY_KEY_RE.search(text, 0, match.start())
+        and not _DAFFY_KEY_RE.search(text, match.end())
+    ):
+        try:
+            return tomllib.loads(match.group())["tool"]["daffy"]
+        except tomllib.TOMLDecodeError:
+            pass
+
+    return tomllib.loads(text).get("tool", {}).get("daffy", {})
+
+
+# Validated settings per pyproject.toml path, with the (mtime_ns, size) they were read at
+_FILE_OVERRIDES_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
+def _read_file_overrides(cwd: Path | None) -> dict[str, Any]:
+    """Read settings from the [tool.daffy] section of the nearest pyproject.toml.
+
+    An unreadable or malformed file yields no settings; a readable file with invalid
+    values raises. Results are reused while the file's mtime and size are unchanged, so
+    working directories that share a pyproject.toml read it once.
+    """
     config_path = find_config_file(cwd)
     if not config_path:
-        return config
+        return {}
 
+    path = Path(config_path)
     try:
-        with Path(config_path).open("rb") as f:
-            daffy_config = tomli.load(f).get("tool", {}).get("daffy", {})
-
-        for key, default_value in _DEFAULTS.items():
-            if key in daffy_config:
-                val = daffy_config[key]
-                if isinstance(default_value, bool):
-                    if not isinstance(val, bool):
-                        raise TypeError(f"Config '{key}' must be a boolean, got {type(val).__name__}: {val!r}")
-                else:  # isinstance(default_value, int)
-                    if not isinstance(val, int) or isinstance(val, bool):
-                        raise TypeError(f"Config '{key}' must be an integer, got {type(val).__name__}: {val!r}")
-                    if val < 1:
-                        raise ValueError(f"Config '{key}' must be >= 1, got {val}")
-                config[key] = val
-    except (FileNotFoundError, tomli.TOMLDecodeError):
-        pass
-
-    return config
+        stat = path.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _FILE_OVERRIDES_CACHE.get(config_path)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+        daffy_config = _parse_daffy_section(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return {}
+
+    overrides: dict[str, Any] = {}
+    for key, validate in _VALIDATORS:
+        value = daffy_config.get(key, _MISSING)
+        if value is not _MISSING:
+            overrides[key] = validate(key, value)
+
+    _FILE_OVERRIDES_CACHE[config_path] = (file_key, overrides)
+    return overrides
+
+
+def load_config(cwd: Path | None = None) -> dict[str, Any]:
+    """Load daffy configuration from DAFFY_* environment variables and pyproject.toml.
+
+    Environment variables take precedence over the file. When every setting comes from
+    the environment, pyproject.toml is not looked up at all.
+    """
+    env_overrides = _read_env_overrides()
+    if len(env_overrides) == len(_DEFAULTS):
+        return env_overrides
+    file_overrides = _read_file_overrides(cwd)
+    if not (file_overrides or env_overrides):
+        return dict(_DEFAULTS)
+    return {**_DEFAULTS, **file_overrides, **env_overrides}
 
 
 def find_config_file(cwd: Path | None = None) -> str | None:
     """Find pyproject.toml in the current working directory or any parent directory."""
     current_dir = cwd.resolve() if cwd is not None else Path.cwd().resolve()
-    for parent in [current_dir, *current_dir.parents]:
-        path = parent / "pyproject.toml"
-        if path.is_file():
-            return str(path)
-    return None
+    return _find_config_file_from(current_dir)
+
+
+@lru_cache(maxsize=256)
+def _find_config_file_from(directory: Path) -> str | None:
+    """Walk up from a resolved directory to the nearest pyproject.toml.
+
+    Each directory level is cached, found or not, so sibling directories share the
+    lookups of their common ancestors and every directory is stat'ed at most once.
+    `clear_config_cache` drops the cache.
+    """
+    path = directory / "pyproject.toml"
+    if path.is_file():
+        return str(path)
+    if directory.parent == directory:
+        return None
+    return _find_config_file_from(directory.parent)
+
+
+class _ConfigValues(NamedTuple):
+    """Validated configuration in fixed positions, for the per-call settings lookups."""
 
+    strict: bool
+    lazy: bool
+    strict_specs: bool
+    row_validation_max_errors: int
+    checks_max_samples: int
+    allow_empty: bool
 
-@lru_cache(maxsize=128)
-def _get_config_for_cwd(cwd: str) -> MappingProxyType[str, Any]:
-    """Load and cache configuration for a specific current working directory."""
-    return MappingProxyType(load_config(Path(cwd)))
+
+_CONFIG_CACHE_MAXSIZE = 128
+# Per working directory: the mapping served by `get_config` and the same values as a
+# `_ConfigValues` for the per-call settings lookups
+_CONFIG_BY_CWD: dict[str, tuple[MappingProxyType[str, Any], _ConfigValues]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _load_config_entry(cwd: str) -> tuple[MappingProxyType[str, Any], _ConfigValues]:
+    """Load the configuration for `cwd` and cache it, evicting the oldest directory past the bound."""
+    config = load_config(Path(cwd))
+    entry = (MappingProxyType(config), _ConfigValues(**config))
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_BY_CWD[cwd] = entry
+        if len(_CONFIG_BY_CWD) > _CONFIG_CACHE_MAXSIZE:
+            del _CONFIG_BY_CWD[next(iter(_CONFIG_BY_CWD))]
+    return entry
 
 
 def get_config() -> MappingProxyType[str, Any]:
@@ -88,15 +266,33 @@ def get_config() -> MappingProxyType[str, Any]:
     Keyed on the unresolved working directory: resolving symlinks costs a syscall on
     every validated call, and `find_config_file` resolves the path anyway on a cache
     miss. Two aliases of the same directory get two cache entries with equal contents.
+    The key comes from `os.getcwd()` because building a `Path` for it costs several
+    times more than the lookup itself.
+
+    At most `_CONFIG_CACHE_MAXSIZE` directories are kept; past that the oldest entry is
+    evicted, so processes that move through many working directories stay bounded.
 
     Returns an immutable view of the configuration to prevent accidental modification.
     """
-    return _get_config_for_cwd(str(Path.cwd()))
+    cwd = os.getcwd()  # noqa: PTH109
+    return (_CONFIG_BY_CWD.get(cwd) or _load_config_entry(cwd))[0]
+
+
+def _get_config_values() -> _ConfigValues:
+    """Get the configuration for the current working directory as a `_ConfigValues`.
+
+    Validation reads settings on every call, so they are served from a tuple instead
+    of the mapping returned by `get_config`. Both come from the same cache entry.
+    """
+    cwd = os.getcwd()  # noqa: PTH109
+    return (_CONFIG_BY_CWD.get(cwd) or _load_config_entry(cwd))[1]
 
 
 def clear_config_cache() -> None:
     """Clear the configuration cache. Primarily for testing."""
-    _get_config_for_cwd.cache_clear()
+    _CONFIG_BY_CWD.clear()
+    _FILE_OVERRIDES_CACHE.clear()
+    _find_config_file_from.cache_clear()
 
 
 class DecoratorSettings(NamedTuple):
@@ -114,28 +310,24 @@ def resolve_decorator_settings(strict: bool | None, lazy: bool | None, allow_emp
     Reading the config resolves the current working directory, so doing it once per
     validation instead of once per setting keeps that cost off the hot path.
     """
-    config = get_config()
+    values = _get_config_values()
     return DecoratorSettings(
-        strict=strict if strict is not None else bool(config[_KEY_STRICT]),
-        strict_specs=bool(config[_KEY_STRICT_SPECS]),
-        lazy=lazy if lazy is not None else bool(config[_KEY_LAZY]),
-        allow_empty=allow_empty if allow_empty is not None else bool(config[_KEY_ALLOW_EMPTY]),
+        strict=values.strict if strict is None else strict,
+        strict_specs=values.strict_specs,
+        lazy=values.lazy if lazy is None else lazy,
+        allow_empty=values.allow_empty if allow_empty is None else allow_empty,
     )
 
 
-def _get_int_config(param: int | None, key: str, min_value: int = 1) -> int:
-    """Return param if provided, otherwise config value. Validates minimum."""
-    value = param if param is not None else int(get_config()[key])
-    if value < min_value:
-        raise ValueError(f"{key} must be >= {min_value}, got {value}")
-    return value
-
-
 def get_row_validation_max_errors() -> int:
     """Get max_errors setting for row validation."""
-    return _get_int_config(None, _KEY_ROW_VALIDATION_MAX_ERRORS)
+    return _get_config_values().row_validation_max_errors
 
 
 def get_checks_max_samples(max_samples: int | None = None) -> int:
-    """Get max_samples setting for value checks."""
-    return _get_int_config(max_samples, _KEY_CHECKS_MAX_SAMPLES)
+    """Get max_samples setting for value checks. Validates an explicit value's minimum."""
+    if max_samples is None:
+        return _get_config_values().checks_max_samples
+    if max_samples < 1:
+        raise ValueError(f"{_KEY_CHECKS_MAX_SAMPLES} must be >= 1, got {max_samples}")
+    return max_samples
@@ -22,7 +22,7 @@ from daffy.utils import (
     log_dataframe_input,
     log_dataframe_output,
 )
-from daffy.validators.builder import build_validation_pipeline
+from daffy.validators.builder import _cached_validation_pipeline
 from daffy.validators.context import ValidationContext
 
 
@@ -118,7 +118,7 @@ def _run_validations(
     )
 
     settings = resolve_decorator_settings(strict, lazy, allow_empty)
-    pipeline = build_validation_pipeline(
+    pipeline = _cached_validation_pipeline(
         columns=columns,
         strict=settings.strict,
         strict_specs=settings.strict_specs,
@@ -130,6 +130,7 @@ def _run_validations(
         exact_rows=exact_rows,
         allow_empty=settings.allow_empty,
         df_columns=list(ctx.columns),
+        df_column_set=ctx.column_set,
     )
     pipeline.run(ctx)
 
@@ -16,7 +16,7 @@ def is_regex_string(column: str) -> bool:
     return column.startswith(_REGEX_PREFIX) and column.endswith(_REGEX_SUFFIX)
 
 
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=512)
 def compile_regex_pattern(pattern_string: str) -> RegexColumnDef:
     r"""Compile a regex pattern from r/pattern/ format.
 
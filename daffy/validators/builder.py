@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING, Any
 
 from daffy.patterns import compile_regex_pattern, is_regex_string, match_column_with_regex
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Hashable, Sequence
+
+    from daffy.validators.base import Validator
 
 from daffy.validators.checks import ChecksValidator
 from daffy.validators.columns import ColumnsExistValidator, DtypeValidator, NullableValidator, StrictModeValidator
@@ -18,41 +21,75 @@ from daffy.validators.spec_parser import parse_column_spec
 from daffy.validators.uniqueness import CompositeUniqueValidator, UniqueValidator
 
 
-def _resolve_columns(specs: list[str], df_columns: list[str]) -> tuple[list[str], dict[str, list[str]]]:
-    """Resolve column specs to actual columns. Returns (missing_specs, spec_to_columns)."""
-    missing: list[str] = []
-    resolved: dict[str, list[str]] = {}
+def _resolve_columns(specs: list[str], df_columns: list[str], df_column_set: frozenset[str]) -> dict[str, list[str]]:
+    """Resolve column specs to the actual columns they match, one entry per unique spec.
+
+    Required and optional specs are resolved together in a single pass; callers pick
+    out the specs they need from the result. Literal names are looked up in
+    `df_column_set`; regex specs scan `df_columns` to keep the DataFrame's column order.
+    """
+    return {
+        spec: match_column_with_regex(compile_regex_pattern(spec), df_columns)
+        if is_regex_string(spec)
+        else ([spec] if spec in df_column_set else [])
+        for spec in dict.fromkeys(specs)
+    }
+
+
+def _expand_dict_spec(specs: dict[str, Any], resolved: dict[str, list[str]]) -> dict[str, Any]:
+    """Expand spec -> value entries to column -> value using the resolution map."""
+    return {col: value for spec, value in specs.items() for col in resolved.get(spec, ())}
+
+
+def _expand_list_spec(specs: list[str], resolved: dict[str, list[str]]) -> list[str]:
+    """Expand column specs to actual column names using the resolution map."""
+    return [col for spec in specs for col in resolved.get(spec, ())]
 
-    for spec in specs:
-        if is_regex_string(spec):
-            pattern = compile_regex_pattern(spec)
-            matched = match_column_with_regex(pattern, df_columns)
-        else:
-            matched = [spec] if spec in df_columns else []
 
-        resolved[spec] = matched
-        if not matched:
-            missing.append(spec)
+# ParsedColumnSpec attribute, how to expand it to real columns, and the validator it feeds
+_COLUMN_VALIDATOR_SPECS: tuple[tuple[str, Callable[[Any, dict[str, list[str]]], Any], type[Any]], ...] = (
+    ("dtype_constraints", _expand_dict_spec, DtypeValidator),
+    ("non_nullable_columns", _expand_list_spec, NullableValidator),
+    ("unique_columns", _expand_list_spec, UniqueValidator),
+    ("checks_by_column", _expand_dict_spec, ChecksValidator),
+)
 
-    return missing, resolved
+# Returned by _cached_validation_pipeline for calls with nothing to validate, which
+# skips building a pipeline per call. Never handed out by the public builder.
+_EMPTY_PIPELINE_LAZY = ValidationPipeline(lazy=True)
+_EMPTY_PIPELINE_EAGER = ValidationPipeline(lazy=False)
 
 
-def _expand_specs(specs: dict[str, Any] | list[str], resolved: dict[str, list[str]]) -> dict[str, Any] | list[str]:
-    """Expand column specs to actual column names using resolution map."""
-    if isinstance(specs, dict):
-        result: dict[str, Any] = {}
-        for spec, value in specs.items():
-            for col in resolved.get(spec, []):
-                result[col] = value
-        return result
+_PIPELINE_CACHE_MAXSIZE = 128
+_PIPELINE_CACHE: dict[Hashable, ValidationPipeline] = {}
+# Decorated functions may validate from several threads; lookups, inserts and evictions
+# happen under this lock so concurrent evictions can't remove the same entry twice.
+_PIPELINE_CACHE_LOCK = threading.Lock()
 
-    result_list: list[str] = []
-    for spec in specs:
-        result_list.extend(resolved.get(spec, []))
-    return result_list
 
+def _freeze(value: Any) -> Hashable:
+    """Turn a decorator argument into a hashable key, tagged with types so 1 and True differ.
 
-def build_validation_pipeline(  # noqa: C901
+    Raises TypeError if the value holds something unhashable, e.g. a NumPy array of
+    allowed values; such calls are not cached.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), frozenset(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+def clear_pipeline_cache() -> None:
+    """Clear the built-pipeline cache. Primarily for testing."""
+    with _PIPELINE_CACHE_LOCK:
+        _PIPELINE_CACHE.clear()
+
+
+def build_validation_pipeline(
     columns: Sequence[Any] | dict[Any, Any] | None,
     strict: bool,
     strict_specs: bool,
@@ -64,49 +101,149 @@ def build_validation_pipeline(  # noqa: C901
     exact_rows: int | None,
     allow_empty: bool,
     df_columns: list[str],
+    df_column_set: frozenset[str] | None = None,
 ) -> ValidationPipeline:
-    """Build a validation pipeline from decorator parameters."""
-    pipeline = ValidationPipeline(lazy=lazy)
+    """Build a validation pipeline from decorator parameters.
 
+    Pass `df_column_set` when a set of `df_columns` is already at hand (the validation
+    context keeps one) to avoid building it again.
+    """
     has_shape_constraints = min_rows is not None or max_rows is not None or exact_rows is not None or not allow_empty
+    return _assemble_pipeline(
+        columns,
+        strict,
+        strict_specs,
+        lazy,
+        composite_unique,
+        row_validator,
+        min_rows,
+        max_rows,
+        exact_rows,
+        allow_empty,
+        has_shape_constraints,
+        df_columns,
+        df_column_set,
+    )
+
+
+def _cached_validation_pipeline(
+    columns: Sequence[Any] | dict[Any, Any] | None,
+    strict: bool,
+    strict_specs: bool,
+    lazy: bool,
+    composite_unique: list[list[str]] | None,
+    row_validator: type | None,
+    min_rows: int | None,
+    max_rows: int | None,
+    exact_rows: int | None,
+    allow_empty: bool,
+    df_columns: list[str],
+    df_column_set: frozenset[str] | None = None,
+) -> ValidationPipeline:
+    """Return a pipeline for these parameters, reusing earlier pipelines where possible.
+
+    Used by the decorators on every validated call. Pipelines are cached by their
+    arguments and the DataFrame's columns in a bounded least-recently-used cache, so
+    repeated calls on same-schema DataFrames reuse one pipeline. The returned pipeline
+    is shared, which is why this stays private: callers outside the decorators get a
+    pipeline of their own from `build_validation_pipeline`.
+    """
+    has_shape_constraints = min_rows is not None or max_rows is not None or exact_rows is not None or not allow_empty
+    if not (columns or composite_unique or row_validator or has_shape_constraints):
+        return _EMPTY_PIPELINE_LAZY if lazy else _EMPTY_PIPELINE_EAGER
+
+    try:
+        key: Hashable | None = (
+            tuple(df_columns),
+            strict,
+            strict_specs,
+            lazy,
+            row_validator,
+            min_rows,
+            max_rows,
+            exact_rows,
+            allow_empty,
+            _freeze(composite_unique),
+            _freeze(columns),
+        )
+    except TypeError:
+        key = None
+    else:
+        with _PIPELINE_CACHE_LOCK:
+            cached = _PIPELINE_CACHE.pop(key, None)
+            if cached is not None:
+                # Re-insert to mark the entry as most recently used
+                _PIPELINE_CACHE[key] = cached
+                return cached
+
+    pipeline = _assemble_pipeline(
+        columns,
+        strict,
+        strict_specs,
+        lazy,
+        composite_unique,
+        row_validator,
+        min_rows,
+        max_rows,
+        exact_rows,
+        allow_empty,
+        has_shape_constraints,
+        df_columns,
+        df_column_set,
+    )
+
+    if key is not None:
+        with _PIPELINE_CACHE_LOCK:
+            _PIPELINE_CACHE[key] = pipeline
+            if len(_PIPELINE_CACHE) > _PIPELINE_CACHE_MAXSIZE:
+                del _PIPELINE_CACHE[next(iter(_PIPELINE_CACHE))]
+    return pipeline
+
+
+def _assemble_pipeline(
+    columns: Sequence[Any] | dict[Any, Any] | None,
+    strict: bool,
+    strict_specs: bool,
+    lazy: bool,
+    composite_unique: list[list[str]] | None,
+    row_validator: type | None,
+    min_rows: int | None,
+    max_rows: int | None,
+    exact_rows: int | None,
+    allow_empty: bool,
+    has_shape_constraints: bool,
+    df_columns: list[str],
+    df_column_set: frozenset[str] | None,
+) -> ValidationPipeline:
+    validators: list[Validator] = []
     if has_shape_constraints:
-        pipeline.add(
+        validators.append(
             ShapeValidator(min_rows=min_rows, max_rows=max_rows, exact_rows=exact_rows, allow_empty=allow_empty)
         )
 
     if columns:
         spec = parse_column_spec(columns, strict_specs=strict_specs)
+        if df_column_set is None:
+            df_column_set = frozenset(df_columns)
+        resolved_all = _resolve_columns(spec.all_columns, df_columns, df_column_set)
 
-        missing_required, resolved_required = _resolve_columns(spec.required_columns, df_columns)
+        missing_required = [name for name in spec.required_columns if not resolved_all[name]]
         if missing_required:
-            pipeline.add(ColumnsExistValidator(missing_required, df_columns))
+            validators.append(ColumnsExistValidator(missing_required, df_columns))
 
-        _, resolved_optional = _resolve_columns(spec.optional_columns, df_columns)
-        resolved_all = {**resolved_required, **resolved_optional}
-
-        validators = [
-            (spec.dtype_constraints, DtypeValidator),
-            (spec.non_nullable_columns, NullableValidator),
-            (spec.unique_columns, UniqueValidator),
-            (spec.checks_by_column, ChecksValidator),
-        ]
-        for source, validator_cls in validators:
-            if source and (expanded := _expand_specs(source, resolved_all)):
-                pipeline.add(validator_cls(expanded))  # type: ignore[arg-type]
+        for attr, expand, validator_cls in _COLUMN_VALIDATOR_SPECS:
+            source = getattr(spec, attr)
+            if source and (expanded := expand(source, resolved_all)):
+                validators.append(validator_cls(expanded))
 
         if strict:
-            all_matched = set()
-            for cols in resolved_required.values():
-                all_matched.update(cols)
-            for cols in resolved_optional.values():
-                all_matched.update(cols)
-            allowed = set(spec.all_columns) | all_matched
-            pipeline.add(StrictModeValidator(allowed))
+            allowed = set(spec.all_columns).union(*resolved_all.values())
+            validators.append(StrictModeValidator(allowed))
 
     if composite_unique:
-        pipeline.add(CompositeUniqueValidator(composite_unique))
+        validators.append(CompositeUniqueValidator(composite_unique))
 
     if row_validator:
-        pipeline.add(RowValidator(row_validator))
+        validators.append(RowValidator(row_validator))
 
-    return pipeline
+    return ValidationPipeline(lazy=lazy, validators=validators)
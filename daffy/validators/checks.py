@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from daffy.validators.context import ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class ChecksValidator:
     checks_by_column: dict[str, dict[str, Any]]
     max_samples: int | None = None
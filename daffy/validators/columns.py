@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from daffy.validators.context import ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnsExistValidator:
     missing_columns: list[str]
     available_columns: list[str]
@@ -57,7 +57,7 @@ def _dtype_matches(actual: Any, expected: Any) -> bool:
     return _base_dtype(actual_norm) == expected_norm
 
 
-@dataclass
+@dataclass(slots=True)
 class DtypeValidator:
     expected: dict[str, Any]
 
@@ -73,7 +73,7 @@ class DtypeValidator:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class NullableValidator:
     non_nullable_columns: list[str]
 
@@ -102,7 +102,7 @@ class NullableValidator:
         return [f"Null violations: {violation_desc}{ctx.param_info}"]
 
 
-@dataclass
+@dataclass(slots=True)
 class StrictModeValidator:
     allowed_columns: set[str]
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from daffy.validators.context import ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class RowValidator:
     """Validates each row against a Pydantic model.
 
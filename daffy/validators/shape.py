@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     from daffy.validators.context import ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class ShapeValidator:
     min_rows: int | None = None
     max_rows: int | None = None
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from daffy.validators.context import ValidationContext
 
 
-@dataclass
+@dataclass(slots=True)
 class UniqueValidator:
     unique_columns: list[str]
 
@@ -33,7 +33,7 @@ class UniqueValidator:
         return errors
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositeUniqueValidator:
     column_combinations: list[list[str]]
 
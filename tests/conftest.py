@@ -6,11 +6,19 @@ import polars as pl
 import pyarrow as pa
 import pytest
 
+from daffy.config import _ENV_PARSERS
 from daffy.dataframe_types import IntoDataFrame
 
 __all__ = ["IntoDataFrame", "cars", "extended_cars"]
 
 
+@pytest.fixture(autouse=True)
+def _isolate_daffy_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep DAFFY_* variables from the developer's or CI's environment out of the tests."""
+    for _key, name, _parse in _ENV_PARSERS:
+        monkeypatch.delenv(name, raising=False)
+
+
 def make_pandas_df(data: dict[str, Any]) -> pd.DataFrame:
     """Create a pandas DataFrame."""
     return pd.DataFrame(data)
@@ -7,6 +7,7 @@ from unittest.mock import patch
 import pytest
 
 from daffy.config import (
+    _ConfigValues,
     clear_config_cache,
     get_checks_max_samples,
     get_config,
@@ -43,7 +44,7 @@ def _config(**overrides: Any) -> dict[str, Any]:
 @pytest.mark.parametrize("setting", ["strict", "lazy", "allow_empty"])
 @pytest.mark.parametrize("configured", [True, False])
 def test_settings_fall_back_to_config(setting: str, configured: bool) -> None:
-    with patch("daffy.config.get_config", return_value=_config(**{setting: configured})):
+    with patch("daffy.config._get_config_values", return_value=_ConfigValues(**_config(**{setting: configured}))):
         settings = resolve_decorator_settings(None, None, None)
 
     assert getattr(settings, setting) is configured
@@ -55,14 +56,14 @@ def test_explicit_argument_beats_config(position: int, setting: str, explicit: b
     args: list[bool | None] = [None, None, None]
     args[position] = explicit
 
-    with patch("daffy.config.get_config", return_value=_config(**{setting: not explicit})):
+    with patch("daffy.config._get_config_values", return_value=_ConfigValues(**_config(**{setting: not explicit}))):
         settings = resolve_decorator_settings(*args)
 
     assert getattr(settings, setting) is explicit
 
 
 def test_strict_specs_is_read_from_config() -> None:
-    with patch("daffy.config.get_config", return_value=_config(strict_specs=True)):
+    with patch("daffy.config._get_config_values", return_value=_ConfigValues(**_config(strict_specs=True))):
         assert resolve_decorator_settings(None, None, None).strict_specs is True
 
 
@@ -70,7 +71,7 @@ def test_config_from_pyproject(tmp_path: Path) -> None:
     """Test loading configuration from pyproject.toml."""
     write_pyproject(tmp_path, "strict = true")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -83,7 +84,7 @@ def test_strict_specs_from_pyproject(tmp_path: Path) -> None:
     """Verify strict_specs value is read from pyproject config."""
     write_pyproject(tmp_path, "strict_specs = true")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -95,7 +96,7 @@ def test_config_strict_specs_string_raises_error(tmp_path: Path) -> None:
     """Test that non-boolean strict_specs config raises TypeError."""
     write_pyproject(tmp_path, 'strict_specs = "true"')
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -115,7 +116,7 @@ def test_load_config_returns_default_when_file_not_found() -> None:
 def test_load_config_returns_default_when_toml_malformed(tmp_path: Path) -> None:
     (tmp_path / "pyproject.toml").write_text("invalid toml [[[", encoding="utf-8")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         clear_config_cache()
 
         config = get_config()
@@ -123,7 +124,7 @@ def test_load_config_returns_default_when_toml_malformed(tmp_path: Path) -> None
 
 
 def test_find_config_file_returns_none_when_no_pyproject_exists(tmp_path: Path) -> None:
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import find_config_file
 
         result = find_config_file()
@@ -136,7 +137,7 @@ def test_find_config_file_searches_parent_directories(tmp_path: Path) -> None:
     nested_dir.mkdir(parents=True)
     pyproject_path = write_pyproject(project_dir, "strict = true")
 
-    with patch("daffy.config.Path.cwd", return_value=nested_dir):
+    with patch("daffy.config.os.getcwd", return_value=str(nested_dir)):
         from daffy.config import find_config_file
 
         result = find_config_file()
@@ -152,7 +153,7 @@ def test_find_config_file_prefers_nearest_parent(tmp_path: Path) -> None:
     write_pyproject(project_dir, "strict = false")
     package_pyproject = write_pyproject(package_dir, "strict = true")
 
-    with patch("daffy.config.Path.cwd", return_value=nested_dir):
+    with patch("daffy.config.os.getcwd", return_value=str(nested_dir)):
         from daffy.config import find_config_file
 
         result = find_config_file()
@@ -162,7 +163,7 @@ def test_find_config_file_prefers_nearest_parent(tmp_path: Path) -> None:
 def test_load_config_without_strict_setting(tmp_path: Path) -> None:
     write_pyproject(tmp_path, 'other_setting = "value"')
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         clear_config_cache()
 
         config = get_config()
@@ -172,7 +173,7 @@ def test_load_config_without_strict_setting(tmp_path: Path) -> None:
 def test_load_config_daffy_section_without_strict(tmp_path: Path) -> None:
     write_pyproject(tmp_path, 'some_other_setting = "value"')
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         clear_config_cache()
 
         config = get_config()
@@ -180,13 +181,13 @@ def test_load_config_daffy_section_without_strict(tmp_path: Path) -> None:
 
 
 def test_get_checks_max_samples_default() -> None:
-    with patch("daffy.config.get_config", return_value={"checks_max_samples": 5}):
+    with patch("daffy.config._get_config_values", return_value=_ConfigValues(**_config())):
         assert get_checks_max_samples() == 5
 
 
 def test_shipped_defaults(tmp_path: Path) -> None:
     """The defaults applied when no pyproject configures daffy."""
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         clear_config_cache()
         config = get_config()
 
@@ -201,14 +202,14 @@ def test_shipped_defaults(tmp_path: Path) -> None:
 
 
 def test_get_checks_max_samples_override() -> None:
-    with patch("daffy.config.get_config", return_value={"checks_max_samples": 5}):
+    with patch("daffy.config._get_config_values", return_value=_ConfigValues(**_config())):
         assert get_checks_max_samples(10) == 10
 
 
 def test_checks_max_samples_from_pyproject(tmp_path: Path) -> None:
     write_pyproject(tmp_path, "checks_max_samples = 10")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -221,7 +222,7 @@ def test_config_strict_string_raises_error(tmp_path: Path) -> None:
     """Test that non-boolean strict config raises TypeError."""
     write_pyproject(tmp_path, 'strict = "false"')
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -236,7 +237,7 @@ def test_config_max_samples_string_raises_error(tmp_path: Path) -> None:
     """Test that non-integer max_samples config raises TypeError."""
     write_pyproject(tmp_path, 'checks_max_samples = "five"')
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -251,7 +252,7 @@ def test_config_max_samples_zero_raises_error(tmp_path: Path) -> None:
     """Test that max_samples < 1 raises ValueError."""
     write_pyproject(tmp_path, "checks_max_samples = 0")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -266,7 +267,7 @@ def test_config_max_samples_one_passes(tmp_path: Path) -> None:
     """Test that max_samples = 1 is valid (boundary value)."""
     write_pyproject(tmp_path, "checks_max_samples = 1")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -279,7 +280,7 @@ def test_config_row_validation_max_errors_one_passes(tmp_path: Path) -> None:
     """Test that row_validation_max_errors = 1 is valid (boundary value)."""
     write_pyproject(tmp_path, "row_validation_max_errors = 1")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -292,7 +293,7 @@ def test_config_row_validation_max_errors_zero_raises_error(tmp_path: Path) -> N
     """Test that row_validation_max_errors < 1 raises ValueError."""
     write_pyproject(tmp_path, "row_validation_max_errors = 0")
 
-    with patch("daffy.config.Path.cwd", return_value=tmp_path):
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
         from daffy.config import load_config
 
         clear_config_cache()
@@ -313,11 +314,11 @@ def test_get_config_cache_isolated_by_cwd(tmp_path: Path) -> None:
     write_pyproject(project_dir, "strict = true")
 
     clear_config_cache()
-    with patch("daffy.config.Path.cwd", return_value=nested_dir):
+    with patch("daffy.config.os.getcwd", return_value=str(nested_dir)):
         nested_config = get_config()
         assert nested_config["strict"] is True
 
-    with patch("daffy.config.Path.cwd", return_value=external_dir):
+    with patch("daffy.config.os.getcwd", return_value=str(external_dir)):
         external_config = get_config()
         assert external_config["strict"] is False
 
@@ -329,7 +330,7 @@ def test_get_config_uses_cache_for_same_cwd(tmp_path: Path) -> None:
 
     clear_config_cache()
     with (
-        patch("daffy.config.Path.cwd", return_value=tmp_path),
+        patch("daffy.config.os.getcwd", return_value=str(tmp_path)),
         patch("daffy.config.load_config", wraps=load_config) as mocked_load_config,
     ):
         first = get_config()
@@ -340,6 +341,230 @@ def test_get_config_uses_cache_for_same_cwd(tmp_path: Path) -> None:
         assert mocked_load_config.call_count == 1
 
 
-def test_get_int_config_invalid_override() -> None:
+def test_config_values_share_the_cached_config(tmp_path: Path) -> None:
+    from daffy.config import _get_config_values, load_config
+
+    write_pyproject(tmp_path, "strict = true")
+
+    clear_config_cache()
+    with (
+        patch("daffy.config.os.getcwd", return_value=str(tmp_path)) as mocked_getcwd,
+        patch("daffy.config.load_config", wraps=load_config) as mocked_load_config,
+    ):
+        values = _get_config_values()
+        assert mocked_getcwd.call_count == 1
+        config = get_config()
+
+    assert values.strict is config["strict"] is True
+    assert mocked_load_config.call_count == 1
+
+
+def test_get_config_cache_is_bounded(tmp_path: Path) -> None:
+    from daffy.config import _CONFIG_BY_CWD, _CONFIG_CACHE_MAXSIZE
+
+    clear_config_cache()
+    for i in range(_CONFIG_CACHE_MAXSIZE + 50):
+        with patch("daffy.config.os.getcwd", return_value=str(tmp_path / f"job_{i}")):
+            get_config()
+
+    assert len(_CONFIG_BY_CWD) == _CONFIG_CACHE_MAXSIZE
+    assert str(tmp_path / "job_0") not in _CONFIG_BY_CWD
+    assert str(tmp_path / f"job_{_CONFIG_CACHE_MAXSIZE + 49}") in _CONFIG_BY_CWD
+    clear_config_cache()
+
+
+def test_get_checks_max_samples_invalid_override() -> None:
     with pytest.raises(ValueError, match="must be >="):
         get_checks_max_samples(0)
+
+
+def test_find_config_file_caches_lookup_until_cleared(tmp_path: Path) -> None:
+    from daffy.config import find_config_file
+
+    clear_config_cache()
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
+        assert find_config_file() is None
+
+        pyproject_path = write_pyproject(tmp_path, "strict = true")
+        assert find_config_file() is None
+
+        clear_config_cache()
+        assert find_config_file() == str(pyproject_path.resolve())
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("true", True), ("1", True), ("FALSE", False), ("0", False)])
+def test_env_var_overrides_pyproject(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, raw: str, expected: bool) -> None:
+    from daffy.config import load_config
+
+    write_pyproject(tmp_path, f"strict = {str(not expected).lower()}\nlazy = true")
+    monkeypatch.setenv("DAFFY_STRICT", raw)
+
+    config = load_config(tmp_path)
+
+    assert config["strict"] is expected
+    assert config["lazy"] is True
+
+
+@pytest.mark.parametrize("name", ["DAFFY_STRICT", "DAFFY_CHECKS_MAX_SAMPLES"])
+@pytest.mark.parametrize("raw", ["", "  "])
+def test_empty_env_var_is_ignored(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str, raw: str) -> None:
+    from daffy.config import load_config
+
+    write_pyproject(tmp_path, "strict = true\nchecks_max_samples = 7")
+    monkeypatch.setenv(name, raw)
+
+    config = load_config(tmp_path)
+
+    assert config["strict"] is True
+    assert config["checks_max_samples"] == 7
+
+
+def test_env_var_int_setting(monkeypatch: pytest.MonkeyPatch) -> None:
+    from daffy.config import load_config
+
+    monkeypatch.setenv("DAFFY_CHECKS_MAX_SAMPLES", "12")
+
+    with patch("daffy.config.find_config_file", return_value=None):
+        assert load_config()["checks_max_samples"] == 12
+
+
+@pytest.mark.parametrize(
+    ("name", "raw", "message"),
+    [
+        ("DAFFY_LAZY", "maybe", "must be a boolean"),
+        ("DAFFY_ROW_VALIDATION_MAX_ERRORS", "five", "must be an integer"),
+        ("DAFFY_ROW_VALIDATION_MAX_ERRORS", "0", ">= 1"),
+    ],
+)
+def test_invalid_env_var_raises(monkeypatch: pytest.MonkeyPatch, name: str, raw: str, message: str) -> None:
+    from daffy.config import load_config
+
+    monkeypatch.setenv(name, raw)
+
+    with patch("daffy.config.find_config_file", return_value=None), pytest.raises(ValueError, match=message):
+        load_config()
+
+
+def test_pyproject_not_looked_up_when_env_sets_everything(monkeypatch: pytest.MonkeyPatch) -> None:
+    from daffy.config import load_config
+
+    for name in ("STRICT", "LAZY", "STRICT_SPECS", "ALLOW_EMPTY"):
+        monkeypatch.setenv(f"DAFFY_{name}", "true")
+    for name in ("ROW_VALIDATION_MAX_ERRORS", "CHECKS_MAX_SAMPLES"):
+        monkeypatch.setenv(f"DAFFY_{name}", "3")
+
+    with patch("daffy.config.find_config_file") as find:
+        config = load_config()
+
+    find.assert_not_called()
+    assert config == _config(
+        strict=True, lazy=True, strict_specs=True, allow_empty=True, row_validation_max_errors=3, checks_max_samples=3
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        (
+            '[project]\nname = "pkg"\n\n[tool.daffy]\nstrict = true\n\n[tool.ruff]\nline-length = 120\n',
+            {"strict": True},
+        ),
+        ("[tool.daffy]  # validation defaults\r\nlazy = true\r\n", {"lazy": True}),
+        ("[tool.daffy]\nstrict = true\n\n[tool.daffy.extra]\nx = 1\n", {"strict": True, "extra": {"x": 1}}),
+        ('[tool]\ndaffy.strict = true\n[tool.other]\nx = "daffy"\n', {"strict": True}),
+        ('[tool.daffy]\nstrict = true\n\n[tool."daffy".extra]\nx = 1\n', {"strict": True, "extra": {"x": 1}}),
+        ('[project]\ndependencies = ["daffy>=1.0"]\n\n[tool.daffy]\nstrict = true\n', {"strict": True}),
+        (
+            '[tool.copier]\ntemplate = """\n[tool.daffy]\nstrict = true\n\n[tool.ruff]\nline-length = 100\n"""\n',
+            {},
+        ),
+        ("[tool.copier]\ntemplate = '''\n[tool.daffy]\nstrict = true\n'''\n", {}),
+        ('[tool.daffy]\nnote = """\n[not a table]\n"""\n', {"note": "[not a table]\n"}),
+        ('[project]\nname = "pkg"\n', {}),
+    ],
+)
+def test_parse_daffy_section(text: str, expected: dict[str, Any]) -> None:
+    from daffy.config import _parse_daffy_section
+
+    assert _parse_daffy_section(text) == expected
+
+
+def test_parse_daffy_section_ignores_daffy_in_values() -> None:
+    from daffy.config import _parse_daffy_section, tomllib
+
+    section = "[tool.daffy]\nstrict = true"
+    text = f'[project]\ndependencies = [\n    "daffy>=1.0",\n]\n\n{section}\n[tool.other]\nx = "daffy"\n'
+
+    with patch("daffy.config.tomllib.loads", wraps=tomllib.loads) as loads:
+        assert _parse_daffy_section(text) == {"strict": True}
+
+    loads.assert_called_once_with(section)
+
+
+def test_parse_daffy_section_skips_parsing_when_daffy_not_mentioned() -> None:
+    from daffy.config import _parse_daffy_section
+
+    with patch("daffy.config.tomllib.loads") as loads:
+        assert _parse_daffy_section("[tool.ruff]\nline-length = 120\n") == {}
+
+    loads.assert_not_called()
+
+
+def test_unchanged_pyproject_is_parsed_once_across_directories(tmp_path: Path) -> None:
+    from daffy.config import _parse_daffy_section
+
+    write_pyproject(tmp_path, "strict = true")
+    nested_dir = tmp_path / "src"
+    nested_dir.mkdir()
+
+    clear_config_cache()
+    with patch("daffy.config._parse_daffy_section", wraps=_parse_daffy_section) as parse:
+        for cwd in (tmp_path, nested_dir):
+            with patch("daffy.config.os.getcwd", return_value=str(cwd)):
+                assert get_config()["strict"] is True
+
+    assert parse.call_count == 1
+
+
+def test_changed_pyproject_is_parsed_again(tmp_path: Path) -> None:
+    from daffy.config import load_config
+
+    clear_config_cache()
+    write_pyproject(tmp_path, "strict = true")
+    assert load_config(tmp_path)["strict"] is True
+
+    write_pyproject(tmp_path, "strict = false\nlazy = true")
+    config = load_config(tmp_path)
+
+    assert config["strict"] is False
+    assert config["lazy"] is True
+
+
+def test_find_config_file_reuses_ancestor_lookups(tmp_path: Path) -> None:
+    from daffy.config import find_config_file
+
+    pyproject_path = write_pyproject(tmp_path, "strict = true")
+    first_dir = tmp_path / "pkg" / "first"
+    second_dir = tmp_path / "pkg" / "second"
+    first_dir.mkdir(parents=True)
+    second_dir.mkdir()
+
+    clear_config_cache()
+    assert find_config_file(first_dir) == str(pyproject_path.resolve())
+
+    with patch("daffy.config.Path.is_file", autospec=True, side_effect=Path.is_file) as is_file:
+        assert find_config_file(second_dir) == str(pyproject_path.resolve())
+
+    assert [call.args[0].parent for call in is_file.call_args_list] == [second_dir.resolve()]
+
+
+def test_int_settings_read_from_pyproject(tmp_path: Path) -> None:
+    from daffy.config import get_row_validation_max_errors
+
+    write_pyproject(tmp_path, "checks_max_samples = 7")
+
+    clear_config_cache()
+    with patch("daffy.config.os.getcwd", return_value=str(tmp_path)):
+        assert get_checks_max_samples() == 7
+        assert get_row_validation_max_errors() == 5
+    clear_config_cache()
@@ -81,8 +81,10 @@ class TestRowConstraints:
 class TestAllowEmpty:
     def test_config_rejects_empty(self, make_df: DataFrameFactory, monkeypatch: pytest.MonkeyPatch) -> None:
         from daffy import config
+        from daffy.config import _ConfigValues
 
-        monkeypatch.setattr(config, "get_config", lambda: {**config.load_config(), "allow_empty": False})
+        values = _ConfigValues(**config.load_config())._replace(allow_empty=False)
+        monkeypatch.setattr(config, "_get_config_values", lambda: values)
 
         @df_out()
         def f() -> Any:
@@ -93,8 +95,10 @@ class TestAllowEmpty:
 
     def test_decorator_overrides_config(self, make_df: DataFrameFactory, monkeypatch: pytest.MonkeyPatch) -> None:
         from daffy import config
+        from daffy.config import _ConfigValues
 
-        monkeypatch.setattr(config, "get_config", lambda: {**config.load_config(), "allow_empty": False})
+        values = _ConfigValues(**config.load_config())._replace(allow_empty=False)
+        monkeypatch.setattr(config, "_get_config_values", lambda: values)
 
         @df_out(allow_empty=True)
         def f() -> Any:
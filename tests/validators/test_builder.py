@@ -1,10 +1,22 @@
 """Tests for pipeline builder."""
 
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
 import pandas as pd
 import pytest
 from pydantic import BaseModel
 
-from daffy.validators.builder import build_validation_pipeline
+from daffy.patterns import match_column_with_regex
+from daffy.validators.builder import (
+    _cached_validation_pipeline,
+    build_validation_pipeline,
+    clear_pipeline_cache,
+)
 from daffy.validators.checks import ChecksValidator
 from daffy.validators.columns import (
     ColumnsExistValidator,
@@ -13,6 +25,7 @@ from daffy.validators.columns import (
     StrictModeValidator,
 )
 from daffy.validators.context import ValidationContext
+from daffy.validators.pipeline import ValidationPipeline
 from daffy.validators.rows import RowValidator
 from daffy.validators.shape import ShapeValidator
 from daffy.validators.uniqueness import CompositeUniqueValidator, UniqueValidator
@@ -36,6 +49,56 @@ class TestBuildValidationPipeline:
 
         assert len(pipeline) == 0
 
+    @pytest.mark.parametrize("lazy", [True, False])
+    def test_reuses_empty_pipeline_when_no_constraints(self, lazy: bool) -> None:
+        def build() -> ValidationPipeline:
+            return _cached_validation_pipeline(
+                columns=[],
+                strict=True,
+                strict_specs=False,
+                lazy=lazy,
+                composite_unique=None,
+                row_validator=None,
+                min_rows=None,
+                max_rows=None,
+                exact_rows=None,
+                allow_empty=True,
+                df_columns=["a"],
+            )
+
+        pipeline = build()
+
+        assert pipeline is build()
+        assert pipeline.lazy is lazy
+        assert len(pipeline) == 0
+
+    @pytest.mark.parametrize("columns", [None, ["a"]])
+    def test_public_builder_returns_fresh_pipeline(self, columns: list[str] | None) -> None:
+        def build() -> ValidationPipeline:
+            return build_validation_pipeline(
+                columns=columns,
+                strict=False,
+                strict_specs=False,
+                lazy=False,
+                composite_unique=None,
+                row_validator=None,
+                min_rows=None,
+                max_rows=None,
+                exact_rows=None,
+                allow_empty=True,
+                df_columns=["a"],
+            )
+
+        pipeline = build()
+        expected_len = len(pipeline)
+        pipeline.add(ShapeValidator(min_rows=1))
+
+        rebuilt = build()
+
+        assert rebuilt is not pipeline
+        assert len(rebuilt) == expected_len
+        assert len(_build_columns_pipeline(columns, ["a"])) == expected_len
+
     def test_adds_shape_validator_for_min_rows(self) -> None:
         pipeline = build_validation_pipeline(
             columns=None,
@@ -89,6 +152,27 @@ class TestBuildValidationPipeline:
 
         assert any(isinstance(v, ColumnsExistValidator) for v in pipeline.validators)
 
+    def test_literal_columns_are_looked_up_in_given_column_set(self) -> None:
+        pipeline = build_validation_pipeline(
+            columns=["a", "b"],
+            strict=False,
+            strict_specs=False,
+            lazy=False,
+            composite_unique=None,
+            row_validator=None,
+            min_rows=None,
+            max_rows=None,
+            exact_rows=None,
+            allow_empty=True,
+            df_columns=["a", "b"],
+            df_column_set=frozenset({"a"}),
+        )
+
+        assert len(pipeline) == 1
+        validator = pipeline.validators[0]
+        assert isinstance(validator, ColumnsExistValidator)
+        assert validator.missing_columns == ["b"]
+
     def test_skips_columns_exist_validator_when_all_present(self) -> None:
         pipeline = build_validation_pipeline(
             columns=["a", "b"],
@@ -287,6 +371,140 @@ class TestRegexExpansion:
         assert nullable_validator is not None, "NullableValidator not found in pipeline"
         assert set(nullable_validator.non_nullable_columns) == {"col_1", "col_2", "col_3"}
 
+    def test_names_with_regex_metacharacters_are_literal(self) -> None:
+        pipeline = _build_columns_pipeline(["price.usd", "a+b"], ["priceXusd", "aab"])
+
+        missing = next(v for v in pipeline.validators if isinstance(v, ColumnsExistValidator))
+        assert missing.missing_columns == ["price.usd", "a+b"]
+
+    def test_repeated_regex_spec_is_matched_once(self) -> None:
+        clear_pipeline_cache()
+        with patch("daffy.validators.builder.match_column_with_regex", wraps=match_column_with_regex) as matcher:
+            pipeline = build_validation_pipeline(
+                columns=["r/^col_/", "r/^col_/"],
+                strict=False,
+                strict_specs=False,
+                lazy=False,
+                composite_unique=None,
+                row_validator=None,
+                min_rows=None,
+                max_rows=None,
+                exact_rows=None,
+                allow_empty=True,
+                df_columns=["col_1", "col_2"],
+            )
+
+        assert matcher.call_count == 1
+        assert len(pipeline) == 0
+
+
+def _build_columns_pipeline(columns: Any, df_columns: list[str]) -> ValidationPipeline:
+    return _cached_validation_pipeline(
+        columns=columns,
+        strict=False,
+        strict_specs=False,
+        lazy=False,
+        composite_unique=None,
+        row_validator=None,
+        min_rows=None,
+        max_rows=None,
+        exact_rows=None,
+        allow_empty=True,
+        df_columns=df_columns,
+    )
+
+
+class TestPipelineCache:
+    def test_reuses_pipeline_for_same_arguments_and_columns(self) -> None:
+        clear_pipeline_cache()
+
+        first = _build_columns_pipeline({"a": {"checks": {"isin": [1, 2]}}}, ["a", "b"])
+        second = _build_columns_pipeline({"a": {"checks": {"isin": [1, 2]}}}, ["a", "b"])
+
+        assert first is second
+
+    def test_builds_new_pipeline_when_columns_differ(self) -> None:
+        clear_pipeline_cache()
+
+        with_b = _build_columns_pipeline(["a", "b"], ["a", "b"])
+        without_b = _build_columns_pipeline(["a", "b"], ["a"])
+
+        assert with_b is not without_b
+        assert not any(isinstance(v, ColumnsExistValidator) for v in with_b.validators)
+        assert any(isinstance(v, ColumnsExistValidator) for v in without_b.validators)
+
+    def test_values_of_different_types_get_separate_pipelines(self) -> None:
+        clear_pipeline_cache()
+
+        int_bound = _build_columns_pipeline({"a": {"checks": {"eq": 1}}}, ["a"])
+        bool_bound = _build_columns_pipeline({"a": {"checks": {"eq": True}}}, ["a"])
+
+        assert int_bound is not bool_bound
+
+    def test_set_members_of_different_types_get_separate_pipelines(self) -> None:
+        clear_pipeline_cache()
+
+        float_members = _build_columns_pipeline({"a": {"checks": {"isin": {1.0, 2.0}}}}, ["a"])
+        int_members = _build_columns_pipeline({"a": {"checks": {"isin": {1, 2}}}}, ["a"])
+
+        assert float_members is not int_members
+        checks = next(v for v in int_members.validators if isinstance(v, ChecksValidator))
+        assert all(type(value) is int for value in checks.checks_by_column["a"]["isin"])
+
+    def test_unhashable_spec_values_are_built_without_caching(self) -> None:
+        clear_pipeline_cache()
+        columns = {"a": {"checks": {"isin": np.array([1, 2])}}}
+
+        first = _build_columns_pipeline(columns, ["a"])
+        second = _build_columns_pipeline(columns, ["a"])
+
+        assert first is not second
+        assert any(isinstance(v, ChecksValidator) for v in first.validators)
+
+    def test_cache_is_bounded(self) -> None:
+        clear_pipeline_cache()
+
+        first = _build_columns_pipeline(["a"], ["a", "extra_0"])
+        for i in range(1, 200):
+            _build_columns_pipeline(["a"], ["a", f"extra_{i}"])
+
+        assert _build_columns_pipeline(["a"], ["a", "extra_0"]) is not first
+
+    def test_cache_hit_keeps_entry_from_eviction(self) -> None:
+        clear_pipeline_cache()
+
+        hot = _build_columns_pipeline(["a"], ["a", "hot"])
+        for i in range(200):
+            _build_columns_pipeline(["a"], ["a", f"extra_{i}"])
+            assert _build_columns_pipeline(["a"], ["a", "hot"]) is hot
+
+    def test_concurrent_builds_with_eviction(self) -> None:
+        from daffy.validators.builder import _PIPELINE_CACHE_MAXSIZE
+
+        class YieldingDict(dict):
+            """Yields the GIL when iterated, widening the window between picking and evicting the oldest entry."""
+
+            def __iter__(self) -> Iterator[Any]:
+                for key in super().__iter__():
+                    time.sleep(0.0001)
+                    yield key
+
+        cache: dict[Any, ValidationPipeline] = YieldingDict()
+
+        def build_many(thread: int) -> None:
+            for i in range(300):
+                _build_columns_pipeline(["a"], ["a", f"x{thread}_{i}"])
+
+        with (
+            patch("daffy.validators.builder._PIPELINE_CACHE", cache),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            futures = [executor.submit(build_many, thread) for thread in range(8)]
+            for future in futures:
+                future.result()
+
+        assert len(cache) == _PIPELINE_CACHE_MAXSIZE
+
 
 class TestPipelineIntegration:
     def test_full_pipeline_execution(self) -> None:
@@ -311,6 +529,27 @@ class TestPipelineIntegration:
         ctx = ValidationContext(df=pd.DataFrame({"id": pd.array([1, 2, 3], dtype="Int64"), "name": ["a", "b", "c"]}))
         pipeline.run(ctx)
 
+    def test_built_validators_use_slots(self) -> None:
+        class RowModel(BaseModel):
+            id: int
+
+        pipeline = build_validation_pipeline(
+            columns={"id": {"dtype": "int64", "nullable": False, "unique": True, "checks": {"gt": 0}}, "missing": {}},
+            strict=True,
+            strict_specs=False,
+            lazy=False,
+            composite_unique=[["id", "missing"]],
+            row_validator=RowModel,
+            min_rows=1,
+            max_rows=None,
+            exact_rows=None,
+            allow_empty=True,
+            df_columns=["id"],
+        )
+
+        assert len(pipeline) == 9
+        assert not any(hasattr(v, "__dict__") for v in pipeline.validators)
+
     def test_strict_mode_with_optional_columns(self) -> None:
         pipeline = build_validation_pipeline(
             columns={"a": {}, "b": {"required": False}},